@@ -1,17 +1,17 @@
 """The Alarm Clock integration."""
 from __future__ import annotations
+import asyncio
 import logging
 import json
-import voluptuous as vol
-from datetime import datetime, timedelta
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.const import Platform, CONF_NAME
+from homeassistant.const import CONF_NAME
 from homeassistant.config_entries import ConfigEntry
+import homeassistant.helpers.config_validation as cv
 import homeassistant.helpers.device_registry as dr
-import homeassistant.helpers.area_registry as ar
-import homeassistant.helpers as ha
+import homeassistant.helpers.entity_registry as er
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
 
 from .const import (
     DOMAIN,
@@ -22,69 +22,130 @@ from .device import AlarmClockDevice
 
 _LOGGER = logging.getLogger(__name__)
 
-CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
+CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
+
+# Key in hass.data[DOMAIN] for the entity_id -> (entry_id, device) index
+DATA_BY_ENTITY = "_by_entity"
+# Key for the cached list of known canonical entity_ids (debug logging)
+DATA_CANONICAL_IDS = "_canonical_ids"
+
+def _async_get_device(hass: HomeAssistant, entity_id: str) -> AlarmClockDevice | None:
+    """Resolve an entity_id to its alarm clock device."""
+    pair = hass.data[DOMAIN].get(DATA_BY_ENTITY, {}).get(entity_id)
+    if pair is None:
+        return None
+    return pair[1]
+
+def _as_list(value) -> list:
+    """Normalize a service-call target field to a list."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+def _async_resolve_targets(hass: HomeAssistant, call) -> dict[str, AlarmClockDevice]:
+    """Resolve all targeted alarm clock devices in a single registry pass."""
+    data = hass.data[DOMAIN]
+    targets: dict[str, AlarmClockDevice] = {}
+
+    for entity_id in _as_list(call.data.get("entity_id")):
+        device = _async_get_device(hass, entity_id)
+        if device is not None:
+            targets[device.entry_id] = device
+        else:
+            _LOGGER.error("No matching device found for entity %s", entity_id)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Available devices: %s", data.get(DATA_CANONICAL_IDS, []))
+
+    # Only touch the registries when the call actually targets them;
+    # entity_id-only calls (the common case) stay a pure dict lookup
+    device_ids = _as_list(call.data.get("device_id"))
+    if device_ids:
+        device_reg = dr.async_get(hass)
+        for device_id in device_ids:
+            device_entry = device_reg.async_get(device_id)
+            if device_entry is None:
+                continue
+            for domain, entry_id in device_entry.identifiers:
+                if domain == DOMAIN and (entry_data := data.get(entry_id)) is not None:
+                    targets[entry_id] = entry_data["device"]
+
+    area_ids = _as_list(call.data.get("area_id"))
+    if area_ids:
+        ent_reg = er.async_get(hass)
+        for area_id in area_ids:
+            for entity_entry in er.async_entries_for_area(ent_reg, area_id):
+                entry_id = entity_entry.config_entry_id
+                if entry_id and (entry_data := data.get(entry_id)) is not None:
+                    targets[entry_id] = entry_data["device"]
+
+    return targets
 
 async def handle_set_alarm(call):
     """Handle the set_alarm service."""
-    _LOGGER.debug(f"Service call data: {json.dumps(call.data, indent=2)}")
-    
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Service call data: %s", json.dumps(call.data, indent=2))
+
     time_str = call.data.get("time")
-    entity_id = call.data.get("entity_id")
-    
-    _LOGGER.debug(f"Processing set_alarm: time={time_str}, entity_id={entity_id}")
-    
-    if entity_id:
-        try:
-            # Look through all entries for the right device
-            found = False
-            for entry_id, entry_data in call.hass.data[DOMAIN].items():
-                device = entry_data["device"]
-                # Check if this is the right device for this entity_id
-                if entity_id == f"switch.{device.name.lower()}_{device.name.lower()}":
-                    _LOGGER.debug(f"Found matching device with entry_id: {entry_id}")
-                    await device.async_set_alarm(time_str)
-                    _LOGGER.debug(f"Successfully set alarm for {entity_id}")
-                    found = True
-                    break
-            
-            if not found:
-                _LOGGER.error(f"No matching device found for entity {entity_id}")
-                _LOGGER.debug(f"Available devices: {[f'switch.{data['device'].name.lower()}_{data['device'].name.lower()}' for data in call.hass.data[DOMAIN].values()]}")
-        
-        except Exception as e:
-            _LOGGER.error(f"Failed to set alarm: {e}", exc_info=True)
+
+    targets = _async_resolve_targets(call.hass, call)
+    if not targets:
+        return
+
+    # Fan out to all targets concurrently instead of awaiting one by one
+    results = await asyncio.gather(
+        *(device.async_set_alarm(time_str) for device in targets.values()),
+        return_exceptions=True,
+    )
+    for device, result in zip(targets.values(), results):
+        if isinstance(result, Exception):
+            _LOGGER.error("Failed to set alarm for %s: %s", device.name, result)
+
+def _async_extract_target_devices(call) -> dict[str, AlarmClockDevice]:
+    """Extract all targeted devices from a service call."""
+    referenced = async_extract_referenced_entity_ids(call.hass, call)
+    entity_ids = referenced.referenced | referenced.indirectly_referenced
+
+    targets: dict[str, AlarmClockDevice] = {}
+    for entity_id in entity_ids:
+        # Area targets may reference entities of other integrations
+        if not entity_id.startswith(("switch.", "datetime.")):
+            continue
+        device = _async_get_device(call.hass, entity_id)
+        if device is not None:
+            targets[device.entry_id] = device
+        else:
+            _LOGGER.error("No matching device found for entity %s", entity_id)
+    return targets
 
 async def handle_snooze(call):
     """Handle the snooze service."""
-    entity_id = call.data.get("entity_id")
-    
-    if entity_id:
-        try:
-            for entry_id, entry_data in call.hass.data[DOMAIN].items():
-                device = entry_data["device"]
-                if entity_id == f"switch.{device.name.lower()}_{device.name.lower()}":
-                    await device.async_snooze()
-                    break
-            else:
-                _LOGGER.error(f"No matching device found for entity {entity_id}")
-        except Exception as e:
-            _LOGGER.error(f"Failed to snooze: {e}", exc_info=True)
+    targets = _async_extract_target_devices(call)
+    if not targets:
+        return
+
+    results = await asyncio.gather(
+        *(device.async_snooze() for device in targets.values()),
+        return_exceptions=True,
+    )
+    for device, result in zip(targets.values(), results):
+        if isinstance(result, Exception):
+            _LOGGER.error("Failed to snooze %s: %s", device.name, result)
 
 async def handle_stop(call):
     """Handle the stop service."""
-    entity_id = call.data.get("entity_id")
-    
-    if entity_id:
-        try:
-            for entry_id, entry_data in call.hass.data[DOMAIN].items():
-                device = entry_data["device"]
-                if entity_id == f"switch.{device.name.lower()}_{device.name.lower()}":
-                    await device.async_stop()
-                    break
-            else:
-                _LOGGER.error(f"No matching device found for entity {entity_id}")
-        except Exception as e:
-            _LOGGER.error(f"Failed to stop: {e}", exc_info=True)
+    targets = _async_extract_target_devices(call)
+    if not targets:
+        return
+
+    results = await asyncio.gather(
+        *(device.async_stop() for device in targets.values()),
+        return_exceptions=True,
+    )
+    for device, result in zip(targets.values(), results):
+        if isinstance(result, Exception):
+            _LOGGER.error("Failed to stop %s: %s", device.name, result)
 
 async def async_unregister_services(hass: HomeAssistant) -> None:
     """Unregister services."""
@@ -92,17 +153,15 @@ async def async_unregister_services(hass: HomeAssistant) -> None:
     services = ["set_alarm", "snooze", "stop"]
     for service in services:
         if hass.services.has_service(DOMAIN, service):
-            _LOGGER.debug(f"Removing service: {DOMAIN}.{service}")
+            _LOGGER.debug("Removing service: %s.%s", DOMAIN, service)
             hass.services.async_remove(DOMAIN, service)
 
 async def async_register_services(hass: HomeAssistant) -> None:
     """Register services."""
+    if hass.services.has_service(DOMAIN, "set_alarm"):
+        return
+
     _LOGGER.debug("Registering alarm clock services")
-    
-    # Unregister existing services first
-    await async_unregister_services(hass)
-    
-    # Register services
     hass.services.async_register(DOMAIN, "set_alarm", handle_set_alarm)
     hass.services.async_register(DOMAIN, "snooze", handle_snooze)
     hass.services.async_register(DOMAIN, "stop", handle_stop)
@@ -128,9 +187,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         snooze_duration,
     )
     
+    # Index the canonical entity_ids for O(1) lookups; the legacy
+    # datetime.<name>_time naming shares the same index
+    canonical_ids = [
+        device.switch_entity_id,
+        f"datetime.{name.lower()}_time",
+    ]
+    index = hass.data[DOMAIN].setdefault(DATA_BY_ENTITY, {})
+    for canonical in canonical_ids:
+        index[canonical] = (entry.entry_id, device)
+    hass.data[DOMAIN][DATA_CANONICAL_IDS] = list(index)
+
     # Store device reference
     hass.data[DOMAIN][entry.entry_id] = {
         "device": device,
+        "canonical_entity_ids": canonical_ids,
     }
 
     # Set up all platforms
@@ -142,8 +213,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-        
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data["device"].async_shutdown()
+
+        # Drop the entry from the entity_id index
+        index = hass.data[DOMAIN].get(DATA_BY_ENTITY)
+        if index is not None:
+            for canonical in entry_data.get("canonical_entity_ids", []):
+                index.pop(canonical, None)
+            if index:
+                hass.data[DOMAIN][DATA_CANONICAL_IDS] = list(index)
+            else:
+                hass.data[DOMAIN].pop(DATA_BY_ENTITY)
+                hass.data[DOMAIN].pop(DATA_CANONICAL_IDS, None)
+
         # Check if this is the last entry
         if not hass.data[DOMAIN]:
             # Unregister services if this is the last entry
@@ -27,10 +27,14 @@ class SnoozeButton(ButtonEntity):
     def __init__(self, device: AlarmClockDevice) -> None:
         """Initialize the button."""
         self._device = device
-        self._attr_unique_id = f"{device.entry_id}_snooze_button"
+        self._attr_unique_id = device.uid_snooze_button
         self._attr_device_info = device.device_info
         self._attr_name = NAME_SNOOZE_BUTTON
-        device.register_update_callback(self.async_write_ha_state)
+        self._unsub_update = device.register_update_callback(self.async_write_ha_state)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister the device update callback."""
+        self._unsub_update()
 
     @property
     def available(self) -> bool:
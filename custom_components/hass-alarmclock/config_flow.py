@@ -11,9 +11,21 @@ from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 
 from .const import DOMAIN, CONF_SNOOZE_DURATION
+from .device import slugify_name
 
 _LOGGER = logging.getLogger(__name__)
 
+# Built once at import; config flow steps can be re-entered on
+# validation failure and should not rebuild the schema each time
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME): str,
+        vol.Optional(CONF_SNOOZE_DURATION, default=9): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=60)
+        ),
+    }
+)
+
 class AlarmClockConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Alarm Clock."""
 
@@ -27,9 +39,7 @@ class AlarmClockConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             # Create unique ID from name
-            await self.async_set_unique_id(
-                f"alarm_clock_{user_input[CONF_NAME].lower().replace(' ', '_')}"
-            )
+            await self.async_set_unique_id(slugify_name(user_input[CONF_NAME]))
             self._abort_if_unique_id_configured()
 
             return self.async_create_entry(
@@ -39,13 +49,6 @@ class AlarmClockConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_NAME): str,
-                    vol.Optional(CONF_SNOOZE_DURATION, default=9): vol.All(
-                        vol.Coerce(int), vol.Range(min=1, max=60)
-                    ),
-                }
-            ),
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
\ No newline at end of file
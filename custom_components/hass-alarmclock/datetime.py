@@ -31,27 +31,28 @@ class AlarmTimeEntity(DateTimeEntity):
     def __init__(self, device: AlarmClockDevice) -> None:
         """Initialize the entity."""
         self._device = device
-        self._attr_unique_id = f"{device.entry_id}_time"
+        self._attr_unique_id = device.uid_time
         self._attr_device_info = device.device_info
         self._attr_name = NAME_ALARM_TIME
-        device.register_update_callback(self.async_write_ha_state)
+        self._unsub_update = device.register_update_callback(self.async_write_ha_state)
+
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister the device update callback."""
+        self._unsub_update()
 
     @property
     def native_value(self) -> datetime:
         """Return the alarm time and date."""
-        # Use actual alarm time or midnight as default
+        # The device caches the combined datetime; fall back to midnight
+        # today when no alarm is stored
+        next_alarm = self._device.next_alarm
+        if next_alarm is not None:
+            return next_alarm
+
         alarm_time = self._device.alarm_time or time(0, 0)
         alarm_date = self._device.alarm_date or dt.now().date()
-        
-        return dt.now().replace(
-            year=alarm_date.year,
-            month=alarm_date.month,
-            day=alarm_date.day,
-            hour=alarm_time.hour,
-            minute=alarm_time.minute,
-            second=alarm_time.second,
-            microsecond=0
-        )
+        return datetime.combine(alarm_date, alarm_time, tzinfo=dt.DEFAULT_TIME_ZONE)
 
     async def async_set_value(self, value: datetime) -> None:
         """Update the alarm time without activating it."""
@@ -1,10 +1,13 @@
 """Alarm Clock device coordination."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, time, timedelta
+from time import monotonic
 from typing import Any, Callable
 
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers import event
@@ -23,9 +26,63 @@ from .helpers import parse_string
 
 _LOGGER = logging.getLogger(__name__)
 
+# Translation table for name slugging, built once at import
+_SLUG_TABLE = str.maketrans({" ": "_"})
+
+def slugify_name(name: str) -> str:
+    """Return the canonical alarm id slug for a configured name."""
+    return f"alarm_clock_{name.lower().translate(_SLUG_TABLE)}"
+
 class AlarmClockDevice:
     """Representation of an Alarm Clock device."""
 
+    # Tick cadence buckets: far-out alarms refresh coarsely, the final
+    # minutes tick every second
+    _TICK_FAR = timedelta(minutes=1)
+    _TICK_MID = timedelta(seconds=10)
+    _TICK_NEAR = timedelta(seconds=1)
+
+    # Fixed attribute set; avoids a per-instance __dict__ and catches typos
+    __slots__ = (
+        "hass",
+        "entry_id",
+        "name",
+        "switch_entity_id",
+        "_slug",
+        "_trigger_event",
+        "_trigger_payload",
+        "uid_switch",
+        "uid_status",
+        "uid_countdown",
+        "uid_snooze_timer",
+        "uid_time",
+        "uid_snooze_button",
+        "_snooze_duration",
+        "_alarm_time",
+        "_alarm_date",
+        "_original_alarm_time",
+        "_original_alarm_date",
+        "_is_active",
+        "_status",
+        "_remove_alarm_listener",
+        "_snooze_end_time",
+        "_snooze_end_ts",
+        "_last_time_left_s",
+        "_last_status",
+        "_next_alarm_cache",
+        "_trigger_monotonic",
+        "_triggered_for",
+        "_update_callbacks",
+        "_flush_scheduled",
+        "_device_info",
+        "_countdown_coordinator",
+        "_unsub_trigger",
+        "_unsub_tick",
+        "_tick_interval",
+        "_local_tz",
+        "_unsub_core_config",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -37,6 +94,20 @@ class AlarmClockDevice:
         self.hass = hass
         self.entry_id = entry_id
         self.name = name
+        # Cache the canonical switch entity_id; service handlers compare
+        # against it on every call
+        self.switch_entity_id = f"switch.{name.lower()}_{name.lower()}"
+        self._slug = slugify_name(name)
+        # Trigger event name and payload never change; build them once
+        self._trigger_event = f"{DOMAIN}_triggered"
+        self._trigger_payload = {"alarm_id": self._slug}
+        # Entity unique ids, precomputed once for setup and reloads
+        self.uid_switch = f"{entry_id}_switch"
+        self.uid_status = f"{entry_id}_status"
+        self.uid_countdown = f"{entry_id}_countdown"
+        self.uid_snooze_timer = f"{entry_id}_snooze_timer"
+        self.uid_time = f"{entry_id}_time"
+        self.uid_snooze_button = f"{entry_id}_snooze_button"
         self._snooze_duration = timedelta(minutes=snooze_duration)
         
         self._alarm_time = None
@@ -47,29 +118,50 @@ class AlarmClockDevice:
         self._status = STATE_UNSET
         self._remove_alarm_listener = None
         self._snooze_end_time = None  # Track when snooze will end
+        self._snooze_end_ts: float | None = None  # Same deadline as epoch seconds
+        self._last_time_left_s: int | None = None  # Last countdown value broadcast
+        self._last_status: str | None = None
+        self._next_alarm_cache: datetime | None = None
+        self._trigger_monotonic: float | None = None  # Monotonic deadline
+        self._triggered_for: datetime | None = None  # Latch against re-firing
         
         # Store callbacks for entity updates
-        self._update_callbacks: list[Callable[[], None]] = []
+        self._update_callbacks: set[Callable[[], None]] = set()
+        self._flush_scheduled = False
         
-        # Setup countdown timer
+        # DeviceInfo never changes; build it once instead of per property read
+        self._device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=name,
+            manufacturer="DGTLMagician",
+            model="Alarm Clock",
+            sw_version="1.0.0",
+        )
+
+        # Countdown fan-out; refreshed from scheduled wakeups instead of
+        # a fixed 1 s poll. always_update=False lets an unchanged payload
+        # suppress the listener fan-out entirely
         self._countdown_coordinator = DataUpdateCoordinator(
             hass,
             _LOGGER,
             name=f"{name} Countdown",
             update_method=self._async_countdown_update,
-            update_interval=timedelta(seconds=1),
+            update_interval=None,
+            always_update=False,
+        )
+        self._unsub_trigger: Callable[[], None] | None = None
+        self._unsub_tick: Callable[[], None] | None = None
+        self._tick_interval: timedelta | None = None
+        # Cache the local timezone; re-read only when core config changes
+        self._local_tz = dt.DEFAULT_TIME_ZONE
+        self._unsub_core_config = hass.bus.async_listen(
+            EVENT_CORE_CONFIG_UPDATE, self._async_core_config_updated
         )
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.entry_id)},
-            name=self.name,
-            manufacturer="DGTLMagician",
-            model="Alarm Clock",
-            sw_version="1.0.0",
-        )
+        return self._device_info
 
     @property
     def is_active(self) -> bool:
@@ -91,6 +183,15 @@ class AlarmClockDevice:
         """Return the alarm status."""
         return self._status
 
+    @property
+    def is_set(self) -> bool:
+        """Return True if an alarm is set and pending.
+
+        Pure attribute reads; set-time handling already guarantees the
+        cached next alarm is in the future, so no clock lookup is needed.
+        """
+        return self._status == STATE_SET and self._next_alarm_cache is not None
+
     @property
     def snooze_duration(self) -> timedelta:
         """Return the snooze duration."""
@@ -99,54 +200,190 @@ class AlarmClockDevice:
     @property
     def next_alarm(self) -> datetime | None:
         """Return the next alarm datetime."""
+        return self._next_alarm_cache
+
+    @callback
+    def _async_core_config_updated(self, _event) -> None:
+        """Pick up a changed core timezone and relocalize the next alarm."""
+        self._local_tz = dt.DEFAULT_TIME_ZONE
+        self._refresh_next_alarm()
+        # The pending wakeup was armed against the old timezone's UTC
+        # instant; re-arm it on the relocalized deadline
+        if self._is_active:
+            self._schedule_alarm()
+
+    def _set_next_alarm(self, value: datetime | None) -> None:
+        """Store a ready-made next-alarm datetime and its monotonic deadline."""
+        self._next_alarm_cache = value
+        if value is None:
+            self._trigger_monotonic = None
+        else:
+            # Monotonic deadline keeps countdown math off the wall clock
+            self._trigger_monotonic = monotonic() + (value - dt.now()).total_seconds()
+
+    def _refresh_next_alarm(self) -> None:
+        """Recompute the cached next-alarm datetime after a mutation."""
         if self._alarm_time is None or self._alarm_date is None:
-            return None
-        return dt.as_local(datetime.combine(self._alarm_date, self._alarm_time))
+            self._set_next_alarm(None)
+        else:
+            # Attach the cached local tz directly; dt.as_local would do the
+            # same tzinfo replace but with a DEFAULT_TIME_ZONE lookup per call
+            self._set_next_alarm(
+                datetime.combine(
+                    self._alarm_date, self._alarm_time, tzinfo=self._local_tz
+                )
+            )
 
     @property
     def snooze_end_time(self) -> datetime | None:
         """Return when the current snooze will end."""
         return self._snooze_end_time if self._status == STATE_SNOOZED else None
 
-    def register_update_callback(self, callback: Callable[[], None]) -> None:
-        """Register callback for entity updates."""
-        self._update_callbacks.append(callback)
+    @property
+    def snooze_end_ts(self) -> float | None:
+        """Return the snooze deadline as epoch seconds, or None outside snooze."""
+        return self._snooze_end_ts if self._status == STATE_SNOOZED else None
+
+    def register_update_callback(
+        self, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Register callback for entity updates; returns an unregister handle."""
+        self._update_callbacks.add(update_callback)
+        return lambda: self._update_callbacks.discard(update_callback)
 
     def _notify_update(self) -> None:
-        """Notify all registered callbacks of an update."""
-        for callback in self._update_callbacks:
-            callback()
+        """Schedule a batched notify of all registered callbacks.
+
+        Successive state mutations inside one handler (e.g. async_snooze)
+        coalesce into a single flush per event-loop iteration.
+        """
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
 
-    async def _async_countdown_update(self) -> dict[str, timedelta]:
+        # Callers on the HA loop get a plain call_soon; anything else
+        # (e.g. executor jobs) must cross threads safely
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self.hass.loop:
+            self.hass.loop.call_soon(self._flush_updates)
+        else:
+            self.hass.loop.call_soon_threadsafe(self._flush_updates)
+
+    def _flush_updates(self) -> None:
+        """Run all registered entity callbacks once."""
+        self._flush_scheduled = False
+        # Snapshot so callbacks may (un)register during dispatch
+        for update_callback in tuple(self._update_callbacks):
+            update_callback()
+
+    async def _async_countdown_update(self) -> dict[str, Any]:
         """Update countdown timer."""
-        if not self._is_active or self.next_alarm is None:
-            return {"time_left": timedelta(seconds=0)}
-        
-        now = dt.now()
-        next_alarm = self.next_alarm
-        
-        # Ensure next_alarm is timezone-aware
-        if next_alarm.tzinfo is None:
-            next_alarm = dt.as_local(next_alarm)
-        
-        time_left = next_alarm - now
-        
+        if not self._is_active or self._trigger_monotonic is None:
+            # Clear the dirty-check state so the first active refresh
+            # always builds a fresh payload instead of matching stale
+            # pre-idle values
+            self._last_time_left_s = None
+            self._last_status = None
+            # Compares equal to the previous idle payload, so repeated
+            # idle refreshes notify nobody
+            return {"time_left": timedelta(0), "active": False}
+
+        # Pure monotonic delta; no wall-clock read on the refresh path
+        time_left = timedelta(seconds=self._trigger_monotonic - monotonic())
+
         if time_left.total_seconds() <= 0:
             await self._handle_alarm_trigger()
             time_left = timedelta(seconds=0)
-            
-        return {"time_left": time_left}
+
+        # Hand back the previous payload object when the displayed value
+        # is unchanged; with always_update=False the coordinator then
+        # skips the listener fan-out
+        secs = int(time_left.total_seconds())
+        if secs == self._last_time_left_s and self._status == self._last_status:
+            return self._countdown_coordinator.data
+
+        self._last_time_left_s = secs
+        self._last_status = self._status
+        return {"time_left": time_left, "active": True}
+
+    async def async_shutdown(self) -> None:
+        """Tear down scheduled wakeups when the config entry unloads.
+
+        Without this a pending trigger wakeup would still fire for an
+        entry that no longer exists, and the countdown tick would keep
+        refreshing the orphaned coordinator forever.
+        """
+        self._cancel_alarm_schedule()
+        self._unsub_core_config()
+
+    def _cancel_alarm_schedule(self) -> None:
+        """Cancel any scheduled trigger wakeup and countdown tick."""
+        if self._unsub_trigger is not None:
+            self._unsub_trigger()
+            self._unsub_trigger = None
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+
+    def _pick_tick_interval(self) -> timedelta:
+        """Choose a refresh cadence based on the time left until trigger."""
+        remaining = (self._trigger_monotonic or 0.0) - monotonic()
+        if remaining > 3600:
+            return self._TICK_FAR
+        if remaining > 300:
+            return self._TICK_MID
+        return self._TICK_NEAR
+
+    def _schedule_tick(self) -> None:
+        """(Re)start the countdown tick at the cadence the deadline warrants."""
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+        self._tick_interval = self._pick_tick_interval()
+        self._unsub_tick = event.async_track_time_interval(
+            self.hass, self._async_countdown_tick, self._tick_interval
+        )
+
+    def _schedule_alarm(self) -> None:
+        """(Re)schedule the trigger wakeup and the adaptive countdown tick."""
+        self._cancel_alarm_schedule()
+        next_alarm = self.next_alarm
+        if not self._is_active or next_alarm is None:
+            return
+        self._unsub_trigger = event.async_track_point_in_time(
+            self.hass, self._async_on_trigger_time, next_alarm
+        )
+        self._schedule_tick()
+
+    async def _async_on_trigger_time(self, now: datetime) -> None:
+        """Handle the scheduled alarm trigger time."""
+        self._cancel_alarm_schedule()
+        await self._handle_alarm_trigger()
+        await self._countdown_coordinator.async_refresh()
+
+    async def _async_countdown_tick(self, now: datetime) -> None:
+        """Refresh the countdown and tighten the cadence as trigger nears."""
+        await self._countdown_coordinator.async_refresh()
+        if (
+            self._unsub_tick is not None
+            and self._pick_tick_interval() != self._tick_interval
+        ):
+            self._schedule_tick()
 
     async def _handle_alarm_trigger(self) -> None:
         """Handle alarm trigger."""
+        # Fire at most once per scheduled alarm
+        if self._triggered_for == self._next_alarm_cache:
+            return
+        self._triggered_for = self._next_alarm_cache
+
         self._status = STATE_TRIGGERED
         self._notify_update()
         
         # Fire alarm_triggered event
-        self.hass.bus.async_fire(
-            f"{DOMAIN}_triggered",
-            {"alarm_id": f"alarm_clock_{self.name.lower().replace(' ', '_')}"}
-        )
+        self.hass.bus.async_fire(self._trigger_event, self._trigger_payload)
 
     async def async_set_alarm_time_only(self, value: datetime | time | str) -> None:
         """Set the alarm time and date without activating the alarm."""
@@ -168,9 +405,11 @@ class AlarmClockDevice:
             self._original_alarm_date = alarm_datetime.date()
             self._alarm_time = self._original_alarm_time
             self._alarm_date = self._original_alarm_date
-            
+            self._refresh_next_alarm()
+
             # Force countdown update if alarm is active
             if self._is_active:
+                self._schedule_alarm()
                 await self._countdown_coordinator.async_refresh()
                 
             # Notify of the time update
@@ -181,19 +420,23 @@ class AlarmClockDevice:
 
     def _ensure_future_time(self, alarm_datetime: datetime) -> datetime:
         """Ensure the alarm time is in the future."""
-        now = dt.now()
-        
-        # If time is in the past
-        if alarm_datetime <= now:
-            # Add one day to make it tomorrow
-            alarm_datetime = alarm_datetime + timedelta(days=1)
-        
+        # Compare as epoch floats; cheaper than tz-aware datetime ordering
+        # and timedelta construction
+        now_ts = dt.now().timestamp()
+        alarm_ts = alarm_datetime.timestamp()
+        if alarm_ts <= now_ts:
+            days_behind = int((now_ts - alarm_ts) // 86400) + 1
+            alarm_datetime = alarm_datetime + timedelta(days=days_behind)
+
         return alarm_datetime
 
     async def async_set_alarm(self, value: str | datetime | time) -> None:
         """Set the alarm time and date."""
         _LOGGER.debug(f"Setting alarm with value: {value}, type: {type(value)}")
         try:
+            # One clock read per call; "today" stays consistent with "now"
+            now = dt.now()
+
             # Convert string to time/date if needed
             if isinstance(value, str):
                 _LOGGER.debug(f"Parsing string: {value}")
@@ -205,17 +448,20 @@ class AlarmClockDevice:
                 self._original_alarm_time = value.time()
             else:
                 # If only time is provided, use today's date
-                self._original_alarm_date = dt_util.now().date()
+                self._original_alarm_date = now.date()
                 self._original_alarm_time = value
 
             # Set current alarm time and date
             self._alarm_date = self._original_alarm_date
             self._alarm_time = self._original_alarm_time
-            
+            self._refresh_next_alarm()
+
             # Activate alarm
             self._is_active = True
             self._status = STATE_SET
-            
+            self._triggered_for = None
+            self._schedule_alarm()
+
             # Force countdown update
             await self._countdown_coordinator.async_refresh()
             self._notify_update()
@@ -225,34 +471,46 @@ class AlarmClockDevice:
             
     async def async_unset_alarm(self) -> None:
         """Unset the alarm."""
+        # Already fully unset; skip the refresh/notify churn
+        if self._alarm_time is None and not self._is_active:
+            return
         self._alarm_time = None
         self._alarm_date = None
         self._original_alarm_time = None
         self._original_alarm_date = None
         self._snooze_end_time = None
+        self._snooze_end_ts = None
         self._is_active = False
         self._status = STATE_UNSET
-        
+        self._refresh_next_alarm()
+        self._triggered_for = None
+        self._cancel_alarm_schedule()
+
         # Force countdown update
         await self._countdown_coordinator.async_refresh()
         self._notify_update()
 
     async def async_activate(self) -> None:
         """Activate the alarm."""
-        if self._alarm_time is None:
+        if self._alarm_time is None or self._is_active:
             return
         self._is_active = True
         self._status = STATE_SET
-        
+        self._schedule_alarm()
+
         # Force countdown update
         await self._countdown_coordinator.async_refresh()
         self._notify_update()
 
     async def async_deactivate(self) -> None:
         """Deactivate the alarm."""
+        if not self._is_active:
+            return
         self._is_active = False
         self._status = STATE_UNSET
-        
+        self._triggered_for = None
+        self._cancel_alarm_schedule()
+
         # Force countdown update
         await self._countdown_coordinator.async_refresh()
         self._notify_update()
@@ -264,12 +522,19 @@ class AlarmClockDevice:
 
         now = dt.now()
         snooze_until = now + self._snooze_duration
-        
-        # Set the next alarm time
+
+        # Keep the split fields in sync but feed the already-built datetime
+        # straight into the cache instead of splitting and recombining it
         self._alarm_time = snooze_until.time()
         self._alarm_date = snooze_until.date()
+        self._set_next_alarm(snooze_until)
         self._snooze_end_time = snooze_until
+        self._snooze_end_ts = snooze_until.timestamp()
         self._status = STATE_SNOOZED
+        self._schedule_alarm()
+
+        # Force countdown update
+        await self._countdown_coordinator.async_refresh()
         self._notify_update()
 
     async def async_stop(self) -> None:
@@ -281,18 +546,18 @@ class AlarmClockDevice:
         else:
             self._alarm_time = None
             self._alarm_date = None
-        
+        self._refresh_next_alarm()
+
         # Altijd deactiveren en status op unset zetten
         self._is_active = False
         self._status = STATE_UNSET
+        self._triggered_for = None
+        self._cancel_alarm_schedule()
             
         # Reset snooze-related properties
         self._snooze_end_time = None
+        self._snooze_end_ts = None
         
         # Force countdown update since we've changed the state
         await self._countdown_coordinator.async_refresh()
         self._notify_update()
-            
-        # Reset snooze-related properties
-        self._snooze_end_time = None
-        self._notify_update()
@@ -1,5 +1,7 @@
 """Helper functions for Alarm Clock integration."""
 from datetime import time, datetime, date, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 import logging
 import re
 from homeassistant.core import HomeAssistant
@@ -7,6 +9,15 @@ from homeassistant.util import dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fast path for picker-style input; matches HH:MM and HH:MM:SS
+_ISO_TIME_RE = re.compile(r'^([01]?\d|2[0-3]):([0-5]\d)(?::([0-5]\d))?$')
+
+# Numeric date forms: 8-1, 8/1, 8-01-2026, ...
+_NUMERIC_DATE_RE = re.compile(r'^(\d{1,2})[-/\s](\d{1,2})(?:[-/\s](\d{2,4}))?')
+
+# Everything a normalized time string may not contain
+_TIME_JUNK_RE = re.compile(r'[^0-9:apm ]')
+
 class Language:
     """Language specific parsing configuration."""
     def __init__(self, 
@@ -23,8 +34,58 @@ class Language:
         self.time_words = time_words
         self.prepositions = prepositions
 
-# Define supported languages
-LANGUAGES = {
+        # Precompiled per-language patterns; built once at import instead
+        # of re-deriving f-string patterns on every parse
+        at_words = time_words['at']
+        if isinstance(at_words, str):
+            at_words = [at_words]
+        self.at_tokens = [f" {word} " for word in at_words]
+        hour_words = time_words['hour']
+        if isinstance(hour_words, str):
+            hour_words = [hour_words]
+        self.hour_time_res = [
+            re.compile(rf'(\d+(?:[:\.]\d+)?)\s*{re.escape(word)}')
+            for word in hour_words
+        ]
+        # One alternation for "5 january" / "january 5" instead of two
+        # searches per month name
+        in_words = relative_words['in']
+        if isinstance(in_words, str):
+            in_words = [in_words]
+        day_words = relative_words['days']
+        if isinstance(day_words, str):
+            day_words = [day_words]
+        in_alt = '|'.join(re.escape(word) for word in in_words)
+        day_alt = '|'.join(re.escape(word) for word in day_words)
+        self.rel_days_re = re.compile(
+            rf'(?:{in_alt})\s+(?:(?P<num>\d+)|(?P<word>\w+))\s+(?:{day_alt})'
+        )
+        self.month_index = {month: i for i, month in enumerate(months, 1)}
+        self.prep_set = frozenset(prepositions)
+        # Exact-match table for bare relative-day inputs ("tomorrow")
+        self.quick_days = {
+            relative_words['today']: 0,
+            relative_words['tomorrow']: 1,
+        }
+        self.quick_days.update(relative_words.get('days_offset', {}))
+        month_alt = '|'.join(re.escape(month) for month in months)
+        self.month_re = re.compile(
+            rf'(?:(?P<d1>\d{{1,2}})\s+(?P<m1>{month_alt}))'
+            rf'|(?:(?P<m2>{month_alt})\s+(?P<d2>\d{{1,2}}))'
+        )
+        # Union of all time words, longest first so e.g. "afternoon" is
+        # consumed whole rather than losing its "at" prefix
+        all_time_words = []
+        for value in time_words.values():
+            all_time_words.extend(value if isinstance(value, list) else [value])
+        all_time_words.sort(key=len, reverse=True)
+        self.time_word_re = re.compile(
+            '|'.join(re.escape(word) for word in all_time_words)
+        )
+
+# Define supported languages; read-only so nothing can mutate the
+# shared parser configuration at runtime
+LANGUAGES = MappingProxyType({
     'en': Language(
         name='English',
         weekdays=['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday'],
@@ -87,78 +148,86 @@ LANGUAGES = {
         },
         prepositions=['voor', 'op', 'om', 'in']
     )
-}
+})
+
+# One anchored alternation covering every supported time shape; the
+# matching named group identifies the branch
+_TIME_DISPATCH_RE = re.compile(
+    r'^(?:'
+    r'(?P<h>\d{1,2}):(?P<m>\d{2})(?:\s*(?P<ap>[ap])m?)?'  # 7:30 / 7:30pm
+    r'|(?P<ah>\d{1,2})\s*(?P<ap2>[ap])m?'  # 7pm
+    r'|(?P<num>\d{1,4})'  # 7 / 730
+    r')$'
+)
 
 class DateTimeParser:
     """Parser for date and time strings."""
     def __init__(self, language: str = 'en'):
         """Initialize the parser with language."""
         if language not in LANGUAGES:
-            _LOGGER.warning(f"Unsupported language: {language}, falling back to English")
+            _LOGGER.warning("Unsupported language: %s, falling back to English", language)
             language = 'en'
             
+        self.language = language
         self.lang = LANGUAGES[language]
-        self.reference_date = dt_util.now().date()
+        self._reference_date: date | None = None
+
+    @property
+    def reference_date(self) -> date:
+        """Today's date, sampled lazily and held for the current parse."""
+        if self._reference_date is None:
+            self._reference_date = dt_util.now().date()
+        return self._reference_date
 
     def normalize_date_string(self, date_str: str) -> tuple[str, str]:
         """Normalize date string and extract time part."""
         text = date_str.lower().strip()
+        lang = self.lang
         
         # Extract time part if present
         time_part = None
         date_part = text
         
-        # Look for time indicators
-        at_word = self.lang.time_words['at']
-        hour_words = self.lang.time_words['hour']
-        
-        # Convert to list if not already
-        at_patterns = [at_word] if isinstance(at_word, str) else at_word
-        hour_patterns = [hour_words] if isinstance(hour_words, str) else hour_words
-        
-        # First try with explicit 'at' word
-        for pattern in at_patterns:
-            if f" {pattern} " in text:
-                parts = text.split(f" {pattern} ")
-                date_part = parts[0]
-                if len(parts) > 1:
-                    time_part = parts[1]
-                    break
+        # First try with explicit 'at' word, using the pre-padded tokens
+        for token in lang.at_tokens:
+            # partition finds and splits in one scan instead of a
+            # containment check followed by a full split
+            head, sep, rest = text.partition(token)
+            if sep:
+                date_part = head
+                time_part = rest
+                break
         
         # If no explicit 'at', look for time with hour words
         if not time_part:
-            for hour_word in hour_patterns:
-                match = re.search(rf'(\d+(?:[:\.]\d+)?)\s*{hour_word}', text)
+            for hour_re in lang.hour_time_res:
+                match = hour_re.search(text)
                 if match:
                     time_part = match.group(0)
                     date_part = text.replace(time_part, '').strip()
                     break
         
-        # Clean up date part by removing prepositions
-        for prep in self.lang.prepositions:
-            date_part = re.sub(rf'\b{prep}\b', ' ', date_part)
+        # Prepositions are whole whitespace-delimited tokens, so set
+        # membership replaces the regex word-boundary sub
+        prep_set = lang.prep_set
+        tokens = date_part.split()
+        if not prep_set.isdisjoint(tokens):
+            date_part = ' '.join(t for t in tokens if t not in prep_set)
         
-        # Remove multiple spaces
-        date_part = ' '.join(date_part.split())
+        # Collapse runs of spaces only when one actually exists
+        if '  ' in date_part:
+            date_part = ' '.join(date_part.split())
         return date_part.strip(), time_part
 
     def normalize_time_string(self, time_str: str) -> str:
         """Normalize time string by removing language-specific words."""
         text = time_str.lower().strip()
         
-        # Remove all time-related words
-        for word_list in self.lang.time_words.values():
-            if isinstance(word_list, list):
-                for word in word_list:
-                    text = text.replace(word, '').strip()
-            else:
-                text = text.replace(word_list, '').strip()
-        
-        # Remove multiple spaces
-        text = ' '.join(text.split())
+        # Remove all time-related words in a single pass
+        text = self.lang.time_word_re.sub('', text)
         
         # Keep only relevant characters
-        text = ''.join(c for c in text if c.isdigit() or c in ':apm ')
+        text = _TIME_JUNK_RE.sub('', text)
         
         return text.strip()
 
@@ -169,54 +238,48 @@ class DateTimeParser:
 
         # First normalize the string
         cleaned = self.normalize_time_string(time_str)
-        _LOGGER.debug(f"Parsing normalized time: {cleaned}")
-
-        # Define patterns from simplest to most complex
-        patterns = [
-            # Basic patterns
-            {
-                'pattern': r'^(\d{1,2})$',  # Single number (7)
-                'handler': lambda m: time(int(m.group(1)), 0)
-            },
-            {
-                'pattern': r'^(\d{1,2}):(\d{2})$',  # HH:MM (7:30)
-                'handler': lambda m: time(int(m.group(1)), int(m.group(2)))
-            },
-            {
-                'pattern': r'^(\d{1,2})(\d{2})$',  # HHMM (730)
-                'handler': lambda m: time(int(m.group(1)), int(m.group(2)))
-            },
-            
-            # 12-hour patterns
-            {
-                'pattern': r'^(\d{1,2})\s*([ap])m?$',  # 7pm
-                'handler': lambda m: time(
-                    (int(m.group(1)) % 12) + (12 if m.group(2) == 'p' else 0), 
-                    0
-                )
-            },
-            {
-                'pattern': r'^(\d{1,2}):(\d{2})\s*([ap])m?$',  # 7:30pm
-                'handler': lambda m: time(
-                    (int(m.group(1)) % 12) + (12 if m.group(2) == 'p' else 0),
-                    int(m.group(2))
-                )
-            }
-        ]
+        _LOGGER.debug("Parsing normalized time: %s", cleaned)
 
-        # Try each pattern
-        for p in patterns:
-            match = re.match(p['pattern'], cleaned)
-            if match:
-                try:
-                    result = p['handler'](match)
-                    # Validate the resulting time
-                    if 0 <= result.hour <= 23 and 0 <= result.minute <= 59:
-                        _LOGGER.debug(f"Successfully parsed time: {result}")
-                        return result
-                except (ValueError, IndexError) as e:
-                    _LOGGER.debug(f"Failed to handle match: {e}")
-                    continue
+        # Nothing digit-like survived normalization; skip the pattern loop
+        if not cleaned:
+            raise ValueError(f"Could not parse time: {time_str}")
+
+        # Pure-numeric input (7, 730, 1930) needs no regex at all
+        if cleaned.isdigit() and len(cleaned) <= 4:
+            value = int(cleaned)
+            hour, minute = (value, 0) if len(cleaned) <= 2 else divmod(value, 100)
+            if 0 <= hour <= 23 and 0 <= minute <= 59:
+                result = time(hour, minute)
+                _LOGGER.debug("Successfully parsed time: %s", result)
+                return result
+            raise ValueError(f"Could not parse time: {time_str}")
+
+        # Single anchored match; the named group tells us the shape
+        match = _TIME_DISPATCH_RE.match(cleaned)
+        if match is None:
+            raise ValueError(f"Could not parse time: {time_str}")
+
+        if (num := match.group('num')) is not None:
+            value = int(num)
+            hour, minute = (value, 0) if len(num) <= 2 else divmod(value, 100)
+        elif match.group('h') is not None:
+            hour = int(match.group('h'))
+            minute = int(match.group('m'))
+            if match.group('ap') == 'p':
+                hour = (hour % 12) + 12
+            elif match.group('ap') == 'a':
+                hour = hour % 12
+        else:
+            hour = (int(match.group('ah')) % 12) + (
+                12 if match.group('ap2') == 'p' else 0
+            )
+            minute = 0
+
+        # Validate the resulting time
+        if 0 <= hour <= 23 and 0 <= minute <= 59:
+            result = time(hour, minute)
+            _LOGGER.debug("Successfully parsed time: %s", result)
+            return result
 
         raise ValueError(f"Could not parse time: {time_str}")
 
@@ -233,32 +296,17 @@ class DateTimeParser:
             if expr in text:
                 return self.reference_date + timedelta(days=days)
         
-        # Parse "in X days" pattern using both numeric and word numbers
-        number_words = self.lang.relative_words.get('number_words', {})
-        in_words = self.lang.relative_words['in']
-        day_words = self.lang.relative_words['days']
-        
-        if isinstance(in_words, str):
-            in_words = [in_words]
-        if isinstance(day_words, str):
-            day_words = [day_words]
-        
-        for in_word in in_words:
-            for day_word in day_words:
-                # Try numeric pattern
-                pattern = fr'{in_word}\s+(\d+)\s+{day_word}'
-                match = re.search(pattern, text)
-                if match:
-                    days = int(match.group(1))
-                    return self.reference_date + timedelta(days=days)
-                
-                # Try word pattern
-                pattern = fr'{in_word}\s+(\w+)\s+{day_word}'
-                match = re.search(pattern, text)
-                if match and match.group(1) in number_words:
-                    days = number_words[match.group(1)]
-                    return self.reference_date + timedelta(days=days)
-        
+        # Parse "in X days" with one pattern covering both numeric and
+        # written numbers; the matching group tells the two apart
+        match = self.lang.rel_days_re.search(text)
+        if match:
+            if (num := match.group('num')) is not None:
+                return self.reference_date + timedelta(days=int(num))
+            number_words = self.lang.relative_words.get('number_words', {})
+            days = number_words.get(match.group('word'))
+            if days is not None:
+                return self.reference_date + timedelta(days=days)
+
         return None
 
     def parse_date(self, date_str: str) -> date:
@@ -269,56 +317,76 @@ class DateTimeParser:
         relative_date = self.parse_relative_date(date_str)
         if relative_date:
             return relative_date
-        
+
+        # Month and numeric forms both require a digit; bail before
+        # running either pattern when there is none
+        if not any(c.isdigit() for c in date_str):
+            raise ValueError(f"Could not parse date: {date_str}")
+
         # Check for specific date (e.g., "5 january" or "january 5")
-        for i, month in enumerate(self.lang.months, 1):
-            # Pattern for both "5 january" and "january 5"
-            patterns = [
-                fr"(\d{{1,2}})\s+{month}",
-                fr"{month}\s+(\d{{1,2}})"
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, date_str)
-                if match:
-                    day = int(match.group(1))
-                    year = self.reference_date.year
-                    try:
-                        result = date(year, i, day)
-                        # If the date is in the past, use next year
-                        if result < self.reference_date:
-                            result = date(year + 1, i, day)
-                        return result
-                    except ValueError as e:
-                        raise ValueError(f"Invalid date: {e}")
+        match = self.lang.month_re.search(date_str)
+        if match:
+            if match.group('m1'):
+                month_name = match.group('m1')
+                day = int(match.group('d1'))
+            else:
+                month_name = match.group('m2')
+                day = int(match.group('d2'))
+            month_num = self.lang.month_index[month_name]
+            year = self.reference_date.year
+            try:
+                result = date(year, month_num, day)
+                # If the date is in the past, use next year
+                if result < self.reference_date:
+                    result = date(year + 1, month_num, day)
+                return result
+            except ValueError as e:
+                raise ValueError(f"Invalid date: {e}")
         
         # Check for numeric date (8-1 or 8/1 or 8-01 etc)
-        patterns = [
-            r'(\d{1,2})[-/\s](\d{1,2})(?:[-/\s](\d{2,4}))?',
-        ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, date_str)
-            if match:
-                day = int(match.group(1))
-                month = int(match.group(2))
-                year = int(match.group(3)) if match.group(3) else self.reference_date.year
-                if year < 100:
-                    year += 2000
-                try:
-                    result = date(year, month, day)
-                    if result < self.reference_date:
-                        result = date(year + 1, month, day)
-                    return result
-                except ValueError:
-                    continue
-        
+        match = _NUMERIC_DATE_RE.match(date_str)
+        if match:
+            day = int(match.group(1))
+            month = int(match.group(2))
+            year = int(match.group(3)) if match.group(3) else self.reference_date.year
+            if year < 100:
+                year += 2000
+            try:
+                result = date(year, month, day)
+                if result < self.reference_date:
+                    result = date(year + 1, month, day)
+                return result
+            except ValueError:
+                pass
+
         raise ValueError(f"Could not parse date: {date_str}")
 
     def parse(self, text: str) -> tuple[date, time]:
         """Parse full date/time string."""
+        # Drop the previous call's date sample; it is re-read on first use
+        self._reference_date = None
         text = text.lower().strip()
-        
+
+        # Cheap case first: plain HH:MM[:SS] input (e.g. from a time
+        # picker) skips all language machinery
+        match = _ISO_TIME_RE.match(text)
+        if match:
+            time_obj = time(
+                int(match.group(1)), int(match.group(2)), int(match.group(3) or 0)
+            )
+            return self._get_appropriate_date(time_obj), time_obj
+
+        # O(1) dispatch for bare relative-day inputs; same result the
+        # full normalize/parse_date path would produce
+        offset = self.lang.quick_days.get(text)
+        if offset is not None:
+            date_obj = self.reference_date + timedelta(days=offset)
+            if date_obj > self.reference_date:
+                time_obj = dt_util.now().time()
+            else:
+                time_obj = time(0, 0)
+            return date_obj, time_obj
+
         # Split into date and time components
         date_str, time_str = self.normalize_date_string(text)
         
@@ -328,7 +396,7 @@ class DateTimeParser:
         except ValueError:
             # If parsing as date fails, try parsing the entire string as just a time
             try:
-                time_obj = self.parse_time(text)
+                time_obj = _parse_time_cached(self.language, text)
                 return self._get_appropriate_date(time_obj), time_obj
             except ValueError:
                 # If that fails too, re-raise the original date parsing error
@@ -337,7 +405,7 @@ class DateTimeParser:
         # Parse the time part if present, otherwise use default
         try:
             if time_str:
-                time_obj = self.parse_time(time_str)
+                time_obj = _parse_time_cached(self.language, time_str)
             else:
                 # If no time specified but we have a relative date, use current time
                 if date_obj > self.reference_date:
@@ -345,14 +413,19 @@ class DateTimeParser:
                 else:
                     time_obj = time(0, 0)  # Default to midnight
         except ValueError as e:
-            _LOGGER.debug(f"Time parsing failed: {e}")
+            _LOGGER.debug("Time parsing failed: %s", e)
             time_obj = time(0, 0)  # Default to midnight
         
         return date_obj, time_obj
 
-    def _get_appropriate_date(self, time_obj: time) -> date:
-        """Get appropriate date based on the time (today or tomorrow)."""
-        now = dt_util.now()
+    def _get_appropriate_date(self, time_obj: time, now: datetime | None = None) -> date:
+        """Get appropriate date based on the time (today or tomorrow).
+
+        Callers that already sampled the clock can pass it in so batch
+        parses do not re-read it per string.
+        """
+        if now is None:
+            now = dt_util.now()
         date_obj = now.date()
         
         # If the time is earlier than now, use tomorrow
@@ -361,13 +434,29 @@ class DateTimeParser:
         
         return date_obj
 
+@lru_cache(maxsize=256)
+def _parse_time_cached(language: str, time_str: str) -> time:
+    """Parse a time string for a language, memoized on the raw input.
+
+    Time parsing is deterministic given (language, input) — unlike date
+    parsing, which depends on the current clock — so only this stage is
+    safe to cache. Users tend to reuse a small vocabulary ("7:30",
+    "8 uur"), making repeat parses a single dict lookup.
+    """
+    return DateTimeParser(language).parse_time(time_str)
+
+# Parser instances per language; reused across service calls
+_PARSERS: dict[str, DateTimeParser] = {}
+
 def parse_string(text: str, hass: HomeAssistant = None) -> tuple[date, time]:
     """Parse date/time string using system language."""
     language = 'en'
     if hass:
         language = hass.config.language
         
-    _LOGGER.debug(f"Parsing string: {text} with language: {language}")
+    _LOGGER.debug("Parsing string: %s with language: %s", text, language)
     
-    parser = DateTimeParser(language)
+    parser = _PARSERS.get(language)
+    if parser is None:
+        parser = _PARSERS[language] = DateTimeParser(language)
     return parser.parse(text)
\ No newline at end of file
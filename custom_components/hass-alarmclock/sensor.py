@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from functools import lru_cache
+from time import time as epoch_time
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -13,18 +15,24 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt
 
 from .const import (
     DOMAIN,
     NAME_STATUS,
     NAME_COUNTDOWN,
     NAME_SNOOZE_TIMER,
-    STATE_UNSET,
-    STATE_SNOOZED,
 )
 from .device import AlarmClockDevice
 
+@lru_cache(maxsize=128)
+def _format_hm(hours: int, minutes: int) -> str:
+    """Format an hour/minute pair as HH:MM, shared across entities.
+
+    The pair only changes once a minute while ticks can come far more
+    often, so repeats resolve to a cache hit instead of a new string.
+    """
+    return f"{hours:02d}:{minutes:02d}"
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -48,16 +56,20 @@ class AlarmStatusSensor(SensorEntity):
     def __init__(self, device: AlarmClockDevice) -> None:
         """Initialize the sensor."""
         self._device = device
-        self._attr_unique_id = f"{device.entry_id}_status"
+        self._attr_unique_id = device.uid_status
         self._attr_device_info = device.device_info
         self._attr_name = NAME_STATUS
-        device.register_update_callback(self.async_write_ha_state)
+        self._unsub_update = device.register_update_callback(self.async_write_ha_state)
 
     @property
     def native_value(self) -> str:
         """Return the status."""
         return self._device.status
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister the device update callback."""
+        self._unsub_update()
+
 class AlarmCountdownSensor(CoordinatorEntity, SensorEntity):
     """Sensor for countdown until alarm."""
 
@@ -71,38 +83,36 @@ class AlarmCountdownSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(device._countdown_coordinator)
         self._device = device
-        self._attr_unique_id = f"{device.entry_id}_countdown"
+        self._attr_unique_id = device.uid_countdown
         self._attr_device_info = device.device_info
         self._attr_name = NAME_COUNTDOWN
 
     @property
     def native_value(self) -> int | None:
         """Return the countdown value in seconds."""
-        if not self._device.is_active:
-            return None
-
+        # The coordinator payload carries the active flag, so one dict
+        # read replaces the device property round trip
         data = self.coordinator.data
-        if data and "time_left" in data:
-            return int(data["time_left"].total_seconds())
-        return None
+        if not data or not data["active"]:
+            return None
+        return int(data["time_left"].total_seconds())
 
     @property
     def extra_state_attributes(self) -> dict[str, str | int]:
         """Return the state attributes."""
-        if not self._device.is_active:
+        # native_value already does the active/data checks and the
+        # seconds conversion; reuse it instead of repeating them
+        total_seconds = self.native_value
+        if total_seconds is None:
             return {}
 
-        data = self.coordinator.data
-        if data and "time_left" in data:
-            total_seconds = int(data["time_left"].total_seconds())
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            return {
-                "hours": hours,
-                "minutes": minutes,
-                "formatted": f"{hours:02d}:{minutes:02d}"
-            }
-        return {}
+        hours, remainder = divmod(total_seconds, 3600)
+        minutes = remainder // 60
+        return {
+            "hours": hours,
+            "minutes": minutes,
+            "formatted": _format_hm(hours, minutes)
+        }
 
 class SnoozeTimerSensor(CoordinatorEntity, SensorEntity):
     """Sensor for snooze countdown."""
@@ -117,29 +127,25 @@ class SnoozeTimerSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(device._countdown_coordinator)
         self._device = device
-        self._attr_unique_id = f"{device.entry_id}_snooze_timer"
+        self._attr_unique_id = device.uid_snooze_timer
         self._attr_device_info = device.device_info
         self._attr_name = NAME_SNOOZE_TIMER
 
     @property
     def native_value(self) -> int | None:
         """Return the snooze countdown value in seconds."""
-        if self._device.status != STATE_SNOOZED:
+        # The device caches the deadline as epoch seconds; one float
+        # subtraction replaces the tz-aware datetime and timedelta round trip
+        snooze_end_ts = self._device.snooze_end_ts
+        if snooze_end_ts is None:
             return None
 
-        snooze_end = self._device.snooze_end_time
-        if not snooze_end:
-            return None
-
-        time_left = snooze_end - dt.now()
-        return max(0, int(time_left.total_seconds()))
+        return max(0, int(snooze_end_ts - epoch_time()))
 
     @property
     def extra_state_attributes(self) -> dict[str, str | int]:
         """Return the state attributes."""
-        if self._device.status != STATE_SNOOZED:
-            return {}
-
+        # native_value returns None outside snooze; no separate status check
         value = self.native_value
         if value is not None:
             minutes = value // 60
@@ -29,6 +29,13 @@ SET_ALARM_SCHEMA = vol.Schema({
     vol.Required(CONF_ALARM_TIME): cv.string,
 })
 
+# Entity services registered against this platform
+_ENTITY_SERVICES = (
+    (SERVICE_SET_ALARM, SET_ALARM_SCHEMA, "async_set_alarm"),
+    (SERVICE_SNOOZE, {}, "async_snooze"),
+    (SERVICE_STOP, {}, "async_stop"),
+)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -44,23 +51,8 @@ async def async_setup_entry(
     platform = async_get_current_platform()
 
     # Register services
-    platform.async_register_entity_service(
-        SERVICE_SET_ALARM,
-        SET_ALARM_SCHEMA,
-        "async_set_alarm",
-    )
-
-    platform.async_register_entity_service(
-        SERVICE_SNOOZE,
-        {},
-        "async_snooze",
-    )
-
-    platform.async_register_entity_service(
-        SERVICE_STOP,
-        {},
-        "async_stop",
-    )
+    for service, schema, method in _ENTITY_SERVICES:
+        platform.async_register_entity_service(service, schema, method)
 
 class AlarmClockSwitch(SwitchEntity):
     """Switch for enabling/disabling the alarm."""
@@ -71,11 +63,11 @@ class AlarmClockSwitch(SwitchEntity):
     def __init__(self, device: AlarmClockDevice) -> None:
         """Initialize the switch."""
         self._device = device
-        self._attr_unique_id = f"{device.entry_id}_switch"
+        self._attr_unique_id = device.uid_switch
         _LOGGER.debug(f"Initializing switch with device entry_id: {device.entry_id}")
         _LOGGER.debug(f"Switch unique_id set to: {self._attr_unique_id}")
         self._attr_device_info = device.device_info
-        device.register_update_callback(self.async_write_ha_state)
+        self._unsub_update = device.register_update_callback(self.async_write_ha_state)
 
     @property
     def name(self) -> str:
@@ -88,6 +80,10 @@ class AlarmClockSwitch(SwitchEntity):
         """Return true if switch is on."""
         return self._device.is_active
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister the device update callback."""
+        self._unsub_update()
+
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the switch on."""
         await self._device.async_activate()